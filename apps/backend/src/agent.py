@@ -44,8 +44,10 @@ class DQN:
         # TODO: Get the snake's head position
         # TODO: Helper function to normalize distances
         # TODO: Get current direction as one-hot encoding
+        #       (game.snake.heading is an integer code: UP, RIGHT, DOWN, LEFT)
 
         # TODO: Detect dangers in three directions relative to current direction
+        #       (game.snake.dangers() returns [straight, right, left], 1 = blocked)
         # TODO: Get food direction relative to snake head
         # TODO: Calculate normalized distances to food
         # TODO: Combine all features into a single state vector
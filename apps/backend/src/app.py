@@ -84,6 +84,7 @@ async def update_agent_game_state(game: Game, agent: Any) -> None:
     # TODO: Get the current game state for the agent
     # TODO: Have the agent choose an action (forward, turn left, turn right)
     # TODO: Convert the agent's action to a game direction
+    #       (TURNS[game.snake.heading][action.index(1)] from directions.py)
     # TODO: Apply the direction change to the game
     # TODO: Step the game forward one frame
     # TODO: Calculate the reward for this action
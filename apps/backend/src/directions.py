@@ -0,0 +1,40 @@
+"""
+Integer-coded directions and precomputed turn tables.
+
+Directions are numbered clockwise, so turning right is +1 and turning left
+is -1 (modulo 4). Everything the game needs per tick is a table lookup:
+
+    new_direction = TURNS[snake.heading][action]   # action: 0 straight, 1 right, 2 left
+    dx, dy = DIRECTION_VECTORS[new_direction]
+"""
+
+from typing import Dict, Tuple
+
+
+# Direction codes in clockwise order
+UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
+
+# (dx, dy) for each direction code - y grows downwards on the grid
+DIRECTION_VECTORS: Tuple[Tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+# Names used by the frontend and Snake.change_direction()
+DIRECTION_NAMES: Tuple[str, ...] = ("UP", "RIGHT", "DOWN", "LEFT")
+
+# Reverse lookups from names and vectors back to direction codes
+DIRECTION_CODES: Dict[str, int] = {
+    name: code for code, name in enumerate(DIRECTION_NAMES)
+}
+VECTOR_CODES: Dict[Tuple[int, int], int] = {
+    vector: code for code, vector in enumerate(DIRECTION_VECTORS)
+}
+
+# Action indices, matching the agent's [straight, right, left] action vector
+STRAIGHT, TURN_RIGHT, TURN_LEFT = 0, 1, 2
+
+# TURNS[direction][action] -> new direction
+TURNS: Tuple[Tuple[int, int, int], ...] = tuple(
+    (code, (code + 1) % 4, (code - 1) % 4) for code in range(4)
+)
+
+# Values stored in the snake's occupancy grid
+EMPTY, BODY, WALL = 0, 1, 2
@@ -0,0 +1,348 @@
+"""
+Greedy evaluation harness for saved LinearQNet checkpoints.
+
+Plays thousands of episodes with epsilon = 0 (always the best action) on a
+fixed set of seeds, so different checkpoints are compared on exactly the same
+games. Episodes are played in batches: every game in a batch advances one step
+at a time, and the neural network scores all of their states in one forward
+pass. Batches are spread across worker processes.
+
+Usage:
+    python src/evaluate.py model/model_a.pth model/model_b.pth
+    python src/evaluate.py model/*.pth --episodes 5000 --workers 8 --json results.json
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from agent import DQN
+from directions import TURNS, WALL
+from game import Game
+from model import LinearQNet
+
+
+# Default evaluation settings
+DEFAULT_EPISODES = 2000  # Number of seeded games per checkpoint
+DEFAULT_BATCH_SIZE = 256  # Games advanced together per forward pass
+DEFAULT_MAX_STEPS = 5000  # Hard cap on episode length
+DEFAULT_STALL_STEPS = 500  # Give up if no food is eaten for this many steps
+
+# Models loaded once per worker process by _init_worker()
+_worker_models: List[Any] = []
+_worker_agent: Optional[DQN] = None
+
+
+def load_model(path: str) -> Any:
+    """
+    Load a saved LinearQNet state dictionary for inference.
+
+    The layer sizes are read from the saved weights, so checkpoints trained
+    with different hidden sizes or state features can be evaluated together.
+
+    Args:
+        path: Path to a file written by LinearQNet.save()
+
+    Returns:
+        The model in evaluation mode
+    """
+    state_dict = torch.load(path, map_location="cpu")
+
+    # Weight matrices are stored as (out_features, in_features)
+    weights = [tensor for tensor in state_dict.values() if tensor.dim() == 2]
+    input_size = weights[0].shape[1]
+    hidden_size = weights[0].shape[0]
+    output_size = weights[-1].shape[0]
+
+    model = LinearQNet(input_size, hidden_size, output_size)
+    model.load_state_dict(state_dict)
+    model.eval()
+    return model
+
+
+def death_cause(game: Game) -> str:
+    """
+    Work out why a finished game ended.
+
+    Returns:
+        "full" if the snake filled the grid, "wall" if it moved off the grid,
+        otherwise "self" (it ran into its own body)
+    """
+    if len(game.snake.body) >= game.grid_width * game.grid_height:
+        return "full"
+
+    # A collision leaves the head where it was, so look one step ahead
+    snake = game.snake
+    if snake.occupied[snake.head_index + snake.offsets[snake.heading]] == WALL:
+        return "wall"
+    return "self"
+
+
+def play_batch(
+    model: Any,
+    agent: DQN,
+    seeds: List[int],
+    max_steps: int = DEFAULT_MAX_STEPS,
+    stall_steps: int = DEFAULT_STALL_STEPS,
+) -> List[Dict[str, Any]]:
+    """
+    Play one greedy episode per seed, advancing all games together.
+
+    Args:
+        model: Network that maps a batch of states to Q-values
+        agent: Agent whose get_state() produces the network's input features
+        seeds: One game seed per episode
+        max_steps: Hard cap on episode length
+        stall_steps: End an episode if no food is eaten for this many steps
+
+    Returns:
+        One result dictionary per seed, in the same order as seeds
+    """
+    games = [Game(seed) for seed in seeds]
+    results: List[Dict[str, Any]] = [
+        {"seed": seed, "score": 0, "length": 0, "first_food": None, "death": None}
+        for seed in seeds
+    ]
+    last_food = [0] * len(games)
+    active = list(range(len(games)))
+
+    with torch.no_grad():
+        while active:
+            # Score every active game in a single forward pass
+            states = torch.stack(
+                [
+                    torch.as_tensor(agent.get_state(games[i]), dtype=torch.float32)
+                    for i in active
+                ]
+            )
+            moves = torch.argmax(model(states), dim=1).tolist()
+
+            still_active = []
+            for i, move in zip(active, moves):
+                game = games[i]
+                result = results[i]
+
+                game.queue_change(TURNS[game.snake.heading][move])
+                game.step()
+                result["length"] += 1
+
+                if game.score > result["score"]:
+                    result["score"] = game.score
+                    last_food[i] = result["length"]
+                    if result["first_food"] is None:
+                        result["first_food"] = result["length"]
+
+                if not game.running:
+                    result["death"] = death_cause(game)
+                elif (
+                    result["length"] >= max_steps
+                    or result["length"] - last_food[i] >= stall_steps
+                ):
+                    result["death"] = "timeout"
+                else:
+                    still_active.append(i)
+            active = still_active
+
+    return results
+
+
+def _init_worker(paths: List[str]) -> None:
+    """Load every checkpoint once per worker process."""
+    global _worker_models, _worker_agent
+
+    _worker_models = [load_model(path) for path in paths]
+    _worker_agent = DQN()
+
+
+def _init_pool_worker(paths: List[str]) -> None:
+    """Set up a pool worker process."""
+    # Each worker runs its own batches, so extra threads only compete
+    torch.set_num_threads(1)
+    _init_worker(paths)
+
+
+def _run_task(
+    task: Tuple[int, List[int], int, int]
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Play one batch of seeds against one checkpoint inside a worker."""
+    model_index, seeds, max_steps, stall_steps = task
+    results = play_batch(
+        _worker_models[model_index], _worker_agent, seeds, max_steps, stall_steps
+    )
+    return model_index, results
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate per-episode results into summary statistics.
+
+    Returns:
+        Dictionary with score and length statistics, death cause counts and
+        time-to-first-food statistics (over episodes that ate at least once).
+        Statistics of an empty results list are None.
+    """
+    scores = np.array([result["score"] for result in results])
+    lengths = np.array([result["length"] for result in results])
+    first_food = np.array(
+        [result["first_food"] for result in results if result["first_food"] is not None]
+    )
+
+    deaths: Dict[str, int] = {"wall": 0, "self": 0, "timeout": 0, "full": 0}
+    for result in results:
+        deaths[result["death"]] += 1
+
+    def stats(values: Any) -> Dict[str, Optional[float]]:
+        if len(values) == 0:
+            return {"mean": None, "median": None, "p95": None}
+        return {
+            "mean": float(np.mean(values)),
+            "median": float(np.median(values)),
+            "p95": float(np.percentile(values, 95)),
+        }
+
+    return {
+        "episodes": len(results),
+        "score": {**stats(scores), "max": int(scores.max()) if len(scores) else None},
+        "length": stats(lengths),
+        "first_food": {**stats(first_food), "never": len(results) - len(first_food)},
+        "deaths": deaths,
+    }
+
+
+def evaluate_checkpoints(
+    paths: List[str],
+    episodes: int = DEFAULT_EPISODES,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: Optional[int] = None,
+    max_steps: int = DEFAULT_MAX_STEPS,
+    stall_steps: int = DEFAULT_STALL_STEPS,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate checkpoints greedily on the same fixed set of seeds.
+
+    Args:
+        paths: Checkpoint files to evaluate
+        episodes: Number of episodes per checkpoint
+        seed: First seed; episodes use seeds seed, seed + 1, ...
+        batch_size: Number of games advanced together per forward pass
+        workers: Number of worker processes (defaults to the CPU count);
+                 1 runs everything in the current process
+        max_steps: Hard cap on episode length
+        stall_steps: End an episode if no food is eaten for this many steps
+
+    Returns:
+        One summary dictionary per checkpoint, in the same order as paths
+    """
+    seeds = list(range(seed, seed + episodes))
+    batches = [seeds[i : i + batch_size] for i in range(0, len(seeds), batch_size)]
+    tasks = [
+        (model_index, batch, max_steps, stall_steps)
+        for model_index in range(len(paths))
+        for batch in batches
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if not tasks:
+        finished = []
+    elif workers == 1:
+        # Runs in this process, so leave torch's thread settings alone
+        _init_worker(paths)
+        finished = [_run_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_init_pool_worker,
+            initargs=(paths,),
+        ) as executor:
+            finished = list(executor.map(_run_task, tasks))
+
+    # Tasks come back in submission order, so results stay in seed order
+    results: List[List[Dict[str, Any]]] = [[] for _ in paths]
+    for model_index, batch_results in finished:
+        results[model_index].extend(batch_results)
+
+    return [
+        {"checkpoint": path, **summarize(checkpoint_results)}
+        for path, checkpoint_results in zip(paths, results)
+    ]
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    """Print a readable report for one checkpoint."""
+
+    def fmt(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    score, length, first_food = (
+        summary["score"],
+        summary["length"],
+        summary["first_food"],
+    )
+    deaths = ", ".join(f"{cause} {count}" for cause, count in summary["deaths"].items())
+
+    best = "-" if score["max"] is None else score["max"]
+
+    print(f"{summary['checkpoint']} ({summary['episodes']} episodes)")
+    print(
+        f"  score       mean {fmt(score['mean'])}  median {fmt(score['median'])}"
+        f"  p95 {fmt(score['p95'])}  max {best}"
+    )
+    print(
+        f"  length      mean {fmt(length['mean'])}  median {fmt(length['median'])}"
+        f"  p95 {fmt(length['p95'])}"
+    )
+    print(
+        f"  first food  mean {fmt(first_food['mean'])}"
+        f"  median {fmt(first_food['median'])}  p95 {fmt(first_food['p95'])}"
+        f"  never {first_food['never']}"
+    )
+    print(f"  deaths      {deaths}")
+
+
+def main() -> None:
+    """Parse command line arguments and evaluate the given checkpoints."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("checkpoints", nargs="+", help="Saved model files")
+    parser.add_argument("--episodes", type=positive_int, default=DEFAULT_EPISODES)
+    parser.add_argument("--seed", type=int, default=0, help="First episode seed")
+    parser.add_argument("--batch-size", type=positive_int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--workers", type=positive_int, default=None)
+    parser.add_argument("--max-steps", type=positive_int, default=DEFAULT_MAX_STEPS)
+    parser.add_argument("--stall-steps", type=positive_int, default=DEFAULT_STALL_STEPS)
+    parser.add_argument("--json", help="Also write the summaries to this file")
+    args = parser.parse_args()
+
+    summaries = evaluate_checkpoints(
+        args.checkpoints,
+        episodes=args.episodes,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        max_steps=args.max_steps,
+        stall_steps=args.stall_steps,
+    )
+
+    for summary in summaries:
+        print_summary(summary)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summaries, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-import random
 from typing import Tuple, Any
 
 
@@ -17,8 +16,8 @@ class Food:
         # Randomly place food somewhere on the grid
         # Make sure it's within the grid boundaries
         self.position: Tuple[int, int] = (
-            random.randint(0, game.grid_width - 1),
-            random.randint(0, game.grid_height - 1),
+            game.rng.randint(0, game.grid_width - 1),
+            game.rng.randint(0, game.grid_height - 1),
         )
 
         # Track whether the food has been eaten (used for respawning logic)
@@ -50,7 +49,7 @@ class Food:
                 return
 
             # Randomly choose from valid positions
-            self.position = random.choice(valid_positions)
+            self.position = self.game.rng.choice(valid_positions)
             self.eaten = False  # Reset the eaten flag
 
     def check_eaten(self) -> None:
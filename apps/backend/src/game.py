@@ -1,7 +1,8 @@
 from snake import Snake
 from food import Food
+import random
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 
 class Game:
@@ -12,8 +13,19 @@ class Game:
     It serves as the central controller for the entire game.
     """
 
-    def __init__(self) -> None:
-        """Initialize a new game with default settings."""
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize a new game with default settings.
+
+        Args:
+            seed: Optional seed for the game's random number generator.
+                  Games created with the same seed spawn the snake and food
+                  in the same places, which makes evaluation repeatable.
+        """
+        # Private random number generator so every game can be replayed
+        # from its seed without affecting other games
+        self.rng: random.Random = random.Random(seed)
+
         # Grid dimensions (in cells, not pixels)
         self.grid_width: int = 29  # Number of cells horizontally
         self.grid_height: int = 19  # Number of cells vertically
@@ -96,7 +108,8 @@ class Game:
         in a single frame, which could cause it to reverse into itself.
 
         Args:
-            update: Direction string ("UP", "DOWN", "LEFT", "RIGHT")
+            update: Direction string ("UP", "DOWN", "LEFT", "RIGHT") or a
+                    direction code from directions.py
         """
         if not self.running:
             return
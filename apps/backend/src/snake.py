@@ -1,5 +1,15 @@
-import random
-from typing import Tuple, List, Any
+from typing import Tuple, List, Any, Union
+
+from directions import (
+    DOWN,
+    DIRECTION_CODES,
+    DIRECTION_VECTORS,
+    VECTOR_CODES,
+    TURNS,
+    EMPTY,
+    BODY,
+    WALL,
+)
 
 
 class Snake:
@@ -16,8 +26,8 @@ class Snake:
 
         # Start the snake at a random position near the center
         # This prevents the snake from always starting in the exact same spot
-        start_x = random.randint(game.grid_width // 2 - 5, game.grid_width // 2 + 5)
-        start_y = random.randint(game.grid_height // 2 - 5, game.grid_height // 2 + 5)
+        start_x = game.rng.randint(game.grid_width // 2 - 5, game.grid_width // 2 + 5)
+        start_y = game.rng.randint(game.grid_height // 2 - 5, game.grid_height // 2 + 5)
 
         # The body is a list of (x, y) coordinates, starting with just the head
         self.body: List[Tuple[int, int]] = [(start_x, start_y)]
@@ -25,14 +35,69 @@ class Snake:
         # Keep track of the head position for easy access
         self.head: Tuple[int, int] = self.body[0]
 
-        # Direction is represented as (dx, dy) - change in x and y per move
-        # (0, 1) means moving down, (0, -1) means moving up
-        # (1, 0) means moving right, (-1, 0) means moving left
-        self.direction: Tuple[int, int] = (0, 1)  # Start moving down
+        # Heading is an integer direction code from directions.py
+        # (UP, RIGHT, DOWN, LEFT); the (dx, dy) form is available as self.direction
+        self.heading: int = DOWN  # Start moving down
 
         # Flag to indicate if the snake should grow on the next move
         self.grow: bool = False
 
+        # Occupancy grid with a one-cell wall border, stored as a flat array.
+        # Cell (x, y) lives at index (y + 1) * stride + (x + 1), so checking
+        # any neighbour for walls or body is a single lookup - no bounds checks
+        self.build_grid()
+
+    def build_grid(self) -> None:
+        """
+        (Re)build the occupancy grid for the game's current grid size.
+
+        move() and dangers() call this automatically whenever
+        game.grid_width or game.grid_height has changed, so the walls always
+        match the board. If the snake no longer fits on a smaller board the
+        game ends.
+        """
+        width, height = self.game.grid_width, self.game.grid_height
+        self.grid_size: Tuple[int, int] = (width, height)
+        self.stride: int = width + 2
+        self.occupied: bytearray = bytearray([WALL]) * (self.stride * (height + 2))
+        for y in range(height):
+            row = (y + 1) * self.stride
+            self.occupied[row + 1 : row + 1 + width] = bytes(width)
+
+        # Flat index offset of one step in each direction
+        self.offsets: Tuple[int, ...] = tuple(
+            dy * self.stride + dx for dx, dy in DIRECTION_VECTORS
+        )
+
+        # Offsets of the [straight, right, left] neighbours for each heading
+        self.probes: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(self.offsets[turn] for turn in TURNS[heading]) for heading in range(4)
+        )
+
+        # A snake that is (partly) off the board has nowhere valid to be,
+        # so it counts as having hit the wall
+        if any(not (0 <= x < width and 0 <= y < height) for x, y in self.body):
+            self.head_index: int = -1
+            self.game.game_over()
+            return
+
+        for segment in self.body:
+            self.occupied[self.cell_index(segment)] = BODY
+        self.head_index = self.cell_index(self.head)
+
+    @property
+    def direction(self) -> Tuple[int, int]:
+        """Current direction as (dx, dy) - change in x and y per move."""
+        return DIRECTION_VECTORS[self.heading]
+
+    @direction.setter
+    def direction(self, vector: Tuple[int, int]) -> None:
+        self.heading = VECTOR_CODES[vector]
+
+    def cell_index(self, position: Tuple[int, int]) -> int:
+        """Return the index of a grid position in the padded occupancy grid."""
+        return (position[1] + 1) * self.stride + position[0] + 1
+
     def move(self) -> None:
         """
         Move the snake forward in its current direction.
@@ -43,35 +108,42 @@ class Snake:
         3. Updates the snake body
         4. Handles growth
         """
+        # Make sure the walls match the game's current grid size
+        if self.grid_size != (self.game.grid_width, self.game.grid_height):
+            self.build_grid()
+            if self.head_index < 0:
+                return
+
         # Get current head position and direction
         x, y = self.head
-        dx, dy = self.direction
+        dx, dy = DIRECTION_VECTORS[self.heading]
 
         # Calculate where the new head will be
         new_head: Tuple[int, int] = (x + dx, y + dy)
+        new_index = self.head_index + self.offsets[self.heading]
 
         # Check for collisions
-        # Collision with self: new head position is already in the body
-        # Collision with walls: new head is outside the grid boundaries
-        if new_head in self.body or not (
-            0 <= new_head[0] < self.game.grid_width
-            and 0 <= new_head[1] < self.game.grid_height
-        ):
+        # The border cells are walls and body cells are marked, so one
+        # lookup covers both hitting a wall and hitting ourselves
+        if self.occupied[new_index] != EMPTY:
             self.game.game_over()
             return
 
         # Add the new head to the front of the body
         self.body.insert(0, new_head)
+        self.occupied[new_index] = BODY
 
         # If we're not growing, remove the tail to maintain snake length
         # If we are growing, keep the tail to make the snake longer
         if not self.grow:
-            self.body.pop()  # Remove the last segment (tail)
+            tail = self.body.pop()  # Remove the last segment (tail)
+            self.occupied[self.cell_index(tail)] = EMPTY
         else:
             self.grow = False  # Reset growth flag after growing
 
         # Update the head reference
         self.head = new_head
+        self.head_index = new_index
 
     def grow_snake(self) -> None:
         """
@@ -82,25 +154,47 @@ class Snake:
         """
         self.grow = True
 
-    def change_direction(self, direction: str) -> None:
+    def change_direction(self, direction: Union[str, int]) -> None:
         """
         Change the snake's movement direction.
 
         Args:
-            direction: One of "UP", "DOWN", "LEFT", "RIGHT"
+            direction: One of "UP", "DOWN", "LEFT", "RIGHT", or a direction
+                       code from directions.py (e.g. TURNS[heading][action])
 
         Note: The snake cannot reverse directly into itself (e.g., if moving
         right, it cannot immediately move left). The game logic should
         prevent such moves.
         """
-        if direction == "UP":
-            self.direction = (0, -1)
-        elif direction == "DOWN":
-            self.direction = (0, 1)
-        elif direction == "LEFT":
-            self.direction = (-1, 0)
-        elif direction == "RIGHT":
-            self.direction = (1, 0)
+        if isinstance(direction, str):
+            direction = DIRECTION_CODES.get(direction, self.heading)
+
+        # Ignore anything that isn't a valid direction, like unknown names
+        if direction in range(4):
+            self.heading = direction
+
+    def dangers(self) -> List[int]:
+        """
+        Check the cells straight ahead, to the right and to the left.
+
+        Returns:
+            [straight, right, left] - 1 if moving there would hit a wall or
+            the snake's body, 0 if the cell is free
+        """
+        # Make sure the walls match the game's current grid size
+        if self.grid_size != (self.game.grid_width, self.game.grid_height):
+            self.build_grid()
+        if self.head_index < 0:
+            return [1, 1, 1]
+
+        straight, right, left = self.probes[self.heading]
+        index = self.head_index
+        occupied = self.occupied
+        return [
+            int(occupied[index + straight] != EMPTY),
+            int(occupied[index + right] != EMPTY),
+            int(occupied[index + left] != EMPTY),
+        ]
 
     def to_dict(self) -> List[Tuple[int, int]]:
         """